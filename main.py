@@ -5,6 +5,10 @@ import sys
 import os
 import subprocess
 import webbrowser
+import hashlib
+import html
+import json
+import multiprocessing
 
 class SyntaxHighlighter(QSyntaxHighlighter):
     def __init__(self, document, file_extension):
@@ -652,8 +656,160 @@ class Find(QWidget):
                 self.current_search_position = 0
                 print(f"String '{search_text}' not found.")
 
+EXPORT_EXTENSIONS = ("py", "cpp", "html", "css", "js", "json")
+EXPORT_CACHE_FILE = ".coder-export.json"
+# Bump whenever SyntaxHighlighter rules or the page template change,
+# so pages exported by an older version are rendered again.
+EXPORT_FORMAT_VERSION = 1
+_export_app = None
+
+def init_export_worker():
+    # Highlighting formats need a QGuiApplication, but not a display.
+    global _export_app
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    if QGuiApplication.instance() is None:
+        _export_app = QGuiApplication(["coder-export"])
+
+def highlight_to_html(content, file_extension, title=""):
+    document = QTextDocument()
+    document.setPlainText(content)
+    highlighter = SyntaxHighlighter(document, file_extension)
+    highlighter.rehighlight()
+
+    lines = []
+    block = document.begin()
+    while block.isValid():
+        text = block.text()
+        styles = [None] * len(text)
+        for format_range in block.layout().formats():
+            fmt = format_range.format
+            style = f"color: {fmt.foreground().color().name()}"
+            if fmt.fontWeight() == QFont.Bold:
+                style += "; font-weight: bold"
+            end = min(format_range.start + format_range.length, len(text))
+            for i in range(format_range.start, end):
+                styles[i] = style
+
+        line = ""
+        start = 0
+        while start < len(text):
+            end = start
+            while end < len(text) and styles[end] == styles[start]:
+                end += 1
+            chunk = html.escape(text[start:end])
+            if styles[start]:
+                line += f'<span style="{styles[start]}">{chunk}</span>'
+            else:
+                line += chunk
+            start = end
+        lines.append(line)
+        block = block.next()
+
+    return (
+        "<!DOCTYPE html>\n<html>\n<head>\n<meta charset=\"utf-8\">\n"
+        f"<title>{html.escape(title)}</title>\n</head>\n<body>\n"
+        "<pre style=\"font-family: monospace\">" + "\n".join(lines) + "</pre>\n"
+        "</body>\n</html>\n"
+    )
+
+def export_file(job):
+    source_path, relative_path, output_path, previous_hash = job
+    try:
+        with open(source_path, 'rb') as file:
+            data = file.read()
+        content_hash = hashlib.sha256(f"{EXPORT_FORMAT_VERSION}\n".encode() + data).hexdigest()
+        if content_hash == previous_hash and os.path.isfile(output_path):
+            return relative_path, content_hash, "skipped"
+
+        file_extension = os.path.splitext(source_path)[1][1:]
+        page = highlight_to_html(data.decode('utf-8'), file_extension, relative_path)
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        with open(output_path, 'w', encoding='utf-8') as file:
+            file.write(page)
+        return relative_path, content_hash, "exported"
+    except Exception as e:
+        # Don't leave a page for content that could not be exported.
+        try:
+            os.remove(output_path)
+        except OSError:
+            pass
+        return relative_path, None, f"error: {e}"
+
+def export_html(source_dir, output_dir, jobs=None):
+    if not os.path.isdir(source_dir):
+        print(f"Error: Source directory '{source_dir}' not found.")
+        return 1
+    try:
+        os.makedirs(output_dir, exist_ok=True)
+    except OSError as e:
+        print(f"Error: Unable to create output directory '{output_dir}': {e}")
+        return 1
+
+    cache_path = os.path.join(output_dir, EXPORT_CACHE_FILE)
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as file:
+            cache = json.load(file)
+    except (OSError, ValueError):
+        cache = {}
+    if not isinstance(cache, dict):
+        cache = {}
+
+    output_root = os.path.abspath(output_dir)
+    # Only trust cache entries whose page stays inside OUTPUT_DIR.
+    cache = {
+        key: value for key, value in cache.items()
+        if isinstance(key, str) and isinstance(value, str)
+        and os.path.commonpath([output_root, os.path.abspath(os.path.join(output_root, key + ".html"))]) == output_root
+    }
+    export_jobs = []
+    for root, dirs, files in os.walk(source_dir):
+        dirs[:] = sorted(d for d in dirs if os.path.abspath(os.path.join(root, d)) != output_root)
+        for name in sorted(files):
+            if os.path.splitext(name)[1][1:].lower() not in EXPORT_EXTENSIONS:
+                continue
+            source_path = os.path.join(root, name)
+            relative_path = os.path.relpath(source_path, source_dir)
+            output_path = os.path.join(output_dir, relative_path + ".html")
+            export_jobs.append((source_path, relative_path, output_path, cache.get(relative_path)))
+
+    new_cache = {}
+    failed = 0
+    source_files = set(job[1] for job in export_jobs)
+    with multiprocessing.Pool(jobs, initializer=init_export_worker) as pool:
+        for relative_path, content_hash, status in pool.imap_unordered(export_file, export_jobs):
+            print(f"{relative_path}: {status}", flush=True)
+            if content_hash:
+                new_cache[relative_path] = content_hash
+            else:
+                failed += 1
+
+    for relative_path in sorted(set(cache) - source_files):
+        try:
+            os.remove(os.path.join(output_dir, relative_path + ".html"))
+            print(f"{relative_path}: removed", flush=True)
+        except FileNotFoundError:
+            pass
+
+    with open(cache_path, 'w', encoding='utf-8') as file:
+        json.dump(new_cache, file, indent=2, sort_keys=True)
+    return failed
+
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--export-html":
+        jobs = None
+        if len(sys.argv) == 5:
+            try:
+                jobs = int(sys.argv[4])
+            except ValueError:
+                jobs = 0
+        if (len(sys.argv) not in (4, 5) or (jobs is not None and jobs < 1)
+                or os.path.abspath(sys.argv[2]) == os.path.abspath(sys.argv[3])):
+            print("Usage: main.py --export-html SOURCE_DIR OUTPUT_DIR [JOBS]")
+            print("OUTPUT_DIR must differ from SOURCE_DIR and JOBS must be a positive integer.")
+            sys.exit(2)
+        sys.exit(1 if export_html(sys.argv[2], sys.argv[3], jobs) else 0)
+
     app = QApplication(sys.argv)
     editor = CodeEditor()
     